@@ -1,10 +1,14 @@
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 import sqlite3
+import os
+import json
 from datetime import datetime, timedelta
 import logging
-import joblib
-import numpy as np
+import threading
+
+# joblib, numpy and pyarrow are imported inside the functions that need them so that
+# workers only serving SQLite endpoints start without paying for those imports
 
 app = Flask(__name__)
 CORS(app)
@@ -14,6 +18,17 @@ logger = logging.getLogger(__name__)
 
 DB_NAME = 'tick_sightings.db'
 MODEL_PATH = "tick_forecast_model.pkl"
+SNAPSHOT_DIR = 'snapshots'
+
+# Serve range queries from the memory-mapped Arrow snapshots (written by data-handling.py)
+# instead of SQLite. Enable with TICK_API_MODE=snapshot.
+USE_SNAPSHOTS = os.environ.get('TICK_API_MODE', 'sqlite') == 'snapshot'
+
+# Memory-mapped partitions keyed by path, reloaded when the file changes on disk
+snapshot_cache = {}
+
+# Forecast model as (mtime, saved dict), reloaded when the model is retrained
+model_cache = {}
 
 # Creating database connection
 def get_db_connection():
@@ -21,6 +36,101 @@ def get_db_connection():
     conn.row_factory = sqlite3.Row
     return conn
 
+def load_snapshot_manifest():
+    manifest_path = os.path.join(SNAPSHOT_DIR, 'manifest.json')
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path) as f:
+        return json.load(f)
+
+def load_snapshot_partition(rel_path):
+    path = os.path.join(SNAPSHOT_DIR, rel_path)
+    mtime = os.path.getmtime(path)
+    cached = snapshot_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    import pyarrow as pa
+
+    # Memory-mapping keeps the data in the page cache rather than the worker's heap
+    source = pa.memory_map(path, 'r')
+    table = pa.ipc.open_file(source).read_all()
+    snapshot_cache[path] = (mtime, table)
+    return table
+
+# Same filters and ordering as the SQLite search, but only the
+# year/month partitions overlapping the date range are opened
+def query_snapshots(manifest, start_date, end_date, location, species):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    tables = []
+    for key, entry in sorted(manifest['partitions'].items()):
+        if start_date and key < start_date[:7]:
+            continue
+        if end_date and key > end_date[:7]:
+            continue
+        tables.append(load_snapshot_partition(entry['path']))
+
+    if not tables:
+        return []
+
+    table = pa.concat_tables(tables)
+    mask = None
+    filters = [
+        (start_date, pc.greater_equal, 'date'),
+        (end_date, pc.less_equal, 'date'),
+        (location, pc.equal, 'location'),
+        (species, pc.equal, 'species')
+    ]
+    for value, op, column in filters:
+        if not value:
+            continue
+        condition = op(table[column], value)
+        mask = condition if mask is None else pc.and_(mask, condition)
+
+    if mask is not None:
+        table = table.filter(mask)
+
+    table = table.sort_by([('date', 'descending'), ('time', 'descending')])
+    return table.to_pylist()
+
+def load_model():
+    mtime = os.path.getmtime(MODEL_PATH)
+    cached = model_cache.get(MODEL_PATH)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    import joblib
+
+    saved = joblib.load(MODEL_PATH)
+    model_cache[MODEL_PATH] = (mtime, saved)
+    return saved
+
+# Preload the forecast model and snapshot partitions so the first requests don't pay for it
+def warm_up():
+    started = datetime.now()
+    try:
+        if os.path.exists(MODEL_PATH):
+            load_model()
+
+        manifest = load_snapshot_manifest() if USE_SNAPSHOTS else None
+        if manifest:
+            for entry in manifest['partitions'].values():
+                load_snapshot_partition(entry['path'])
+
+        elapsed = (datetime.now() - started).total_seconds()
+        logger.info(f"Warm-up complete in {elapsed:.2f}s")
+    except Exception as e:
+        logger.error(f"Error during warm-up: {e}")
+
+# Runs the warm-up in a background thread so the worker can accept requests straight away.
+# Call this from the WSGI server's post-fork hook when not running via __main__.
+def start_warm_up():
+    thread = threading.Thread(target=warm_up, name='warm-up', daemon=True)
+    thread.start()
+    return thread
+
 # Health check endpoint
 @app.route('/')
 def home():
@@ -87,6 +197,15 @@ def search_sightings():
         location = request.args.get('location', '')
         species = request.args.get('species', '')
         
+        manifest = load_snapshot_manifest() if USE_SNAPSHOTS else None
+        if manifest:
+            results = query_snapshots(manifest, start_date, end_date, location, species)
+            return jsonify({
+                'success': True,
+                'data': results,
+                'count': len(results)
+            })
+        
         conn = get_db_connection()
         cursor = conn.cursor()
         
@@ -364,8 +483,10 @@ def seasonal_patterns():
 @app.route('/api/forecast/trends', methods=['GET'])
 def forecast_trends():
     try:
-        # Load pretrained model + metadata
-        saved = joblib.load(MODEL_PATH)
+        import numpy as np
+
+        # Load pretrained model + metadata (cached after the first call or warm-up)
+        saved = load_model()
         model = saved["model"]
         data_len = saved["data_len"]
         last_year = int(saved["last_year"])
@@ -407,4 +528,7 @@ def forecast_trends():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 if __name__ == '__main__':
+    # Skipping the warm-up in the reloader's parent process, it only watches files
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_warm_up()
     app.run(debug=True, host='0.0.0.0', port=8432)
\ No newline at end of file
@@ -1,10 +1,27 @@
 import sqlite3
 import requests
 import json
+import os
 from datetime import datetime
 import logging
+import pyarrow as pa
 
 API_URL = 'https://dev-task.elancoapps.com/data/tick-sightings'
+SNAPSHOT_DIR = 'snapshots'
+
+# Column layout of the columnar snapshots, mirrors the sightings table
+SNAPSHOT_SCHEMA = pa.schema([
+    ('id', pa.int64()),
+    ('external_id', pa.string()),
+    ('date', pa.string()),
+    ('time', pa.string()),
+    ('location', pa.string()),
+    ('species', pa.string()),
+    ('year', pa.string()),
+    ('month', pa.string()),
+    ('latinName', pa.string()),
+    ('created_at', pa.string())
+])
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -13,7 +30,14 @@ logger = logging.getLogger(__name__)
 class TickDatabase:
     def __init__(self, db_name='tick_sightings.db'):
         self.db_name = db_name
-        self.setup_database()
+        # Schema setup is deferred to the first connection so constructing
+        # a TickDatabase stays cheap on startup paths
+        self.schema_ready = False
+    
+    def get_connection(self):
+        if not self.schema_ready:
+            self.setup_database()
+        return sqlite3.connect(self.db_name)
     
     def setup_database(self):
         # Creating the database schema
@@ -42,11 +66,12 @@ class TickDatabase:
         
         conn.commit()
         conn.close()
+        self.schema_ready = True
         logger.info("Database setup complete")
     
     def insert_sighting(self, sighting_data):
         # Inserting a single sighting. Also skips if it is duplicate entry.
-        conn = sqlite3.connect(self.db_name)
+        conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
@@ -72,6 +97,97 @@ class TickDatabase:
         finally:
             conn.close()
 
+    def get_partition_summary(self):
+        # Row count and highest id per year/month, used to detect changed partitions
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT substr(date, 1, 4) as year, substr(date, 6, 2) as month,
+                   COUNT(*) as count, MAX(id) as max_id
+            FROM sightings
+            WHERE date != ''
+            GROUP BY year, month
+            ORDER BY year, month
+        ''')
+        rows = cursor.fetchall()
+        conn.close()
+        return rows
+
+    def fetch_partition(self, year, month):
+        # All sightings for a single year/month partition
+        conn = self.get_connection()
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT id, external_id, date, time, location, species, year, month,
+                   latinName, created_at
+            FROM sightings
+            WHERE substr(date, 1, 4) = ? AND substr(date, 6, 2) = ?
+            ORDER BY id
+        ''', (year, month))
+        rows = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+        return rows
+
+
+class SnapshotExporter:
+    # Writes the sightings table as year/month partitioned Arrow files for offline analytics.
+    # Only partitions that are new or changed since the last export get rewritten.
+    def __init__(self, db=None, snapshot_dir=SNAPSHOT_DIR):
+        self.db = db or TickDatabase()
+        self.snapshot_dir = snapshot_dir
+        self.manifest_path = os.path.join(snapshot_dir, 'manifest.json')
+
+    def load_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return {'partitions': {}}
+        with open(self.manifest_path) as f:
+            return json.load(f)
+
+    def save_manifest(self, manifest):
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def write_partition(self, year, month):
+        # Arrow IPC file format so the API can memory-map it without copying
+        rel_path = os.path.join(f'year={year}', f'month={month}', 'sightings.arrow')
+        path = os.path.join(self.snapshot_dir, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        table = pa.Table.from_pylist(self.db.fetch_partition(year, month), schema=SNAPSHOT_SCHEMA)
+
+        # Write to a temp file first so readers never see a half written partition
+        tmp_path = path + '.tmp'
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, SNAPSHOT_SCHEMA) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+        return rel_path
+
+    def export(self):
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        manifest = self.load_manifest()
+        partitions = manifest['partitions']
+
+        written = 0
+        for year, month, count, max_id in self.db.get_partition_summary():
+            key = f'{year}-{month}'
+            existing = partitions.get(key)
+            if existing and existing['rows'] == count and existing['max_id'] == max_id:
+                continue
+
+            rel_path = self.write_partition(year, month)
+            partitions[key] = {'path': rel_path, 'rows': count, 'max_id': max_id}
+            written += 1
+
+        manifest['exported_at'] = datetime.now().isoformat(timespec='seconds')
+        self.save_manifest(manifest)
+        logger.info(f"Snapshot export complete: {written} partitions written, "
+                    f"{len(partitions) - written} unchanged")
+        return written
+
 
 class DataIngestion:
     # Initialize with API URL provided by Elanco
@@ -191,4 +307,8 @@ class DataIngestion:
 if __name__ == '__main__':
     # Running the ingestion process
     ingestion = DataIngestion()
-    ingestion.process_and_store()
\ No newline at end of file
+    ingestion.process_and_store()
+
+    # Refreshing the columnar snapshots with any new partitions
+    exporter = SnapshotExporter(ingestion.db)
+    exporter.export()
\ No newline at end of file
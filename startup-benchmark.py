@@ -0,0 +1,52 @@
+import subprocess
+import sys
+import statistics
+import argparse
+
+API_PATH = 'api-backend.py'
+
+# Runs in a fresh interpreter each time: loads the API module and serves one request,
+# which is what a newly scaled worker has to do before it is ready.
+# In eager mode the heavy libraries are imported up front, like the API used to.
+STARTUP_SCRIPT = '''
+import time
+started = time.perf_counter()
+import importlib.util
+if {eager}:
+    import joblib, numpy, pyarrow
+spec = importlib.util.spec_from_file_location('api_backend', {path!r})
+api = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(api)
+loaded = time.perf_counter()
+api.app.test_client().get('/api/sightings?per_page=10')
+ready = time.perf_counter()
+print(loaded - started, ready - started)
+'''
+
+def measure(eager, runs):
+    import_times = []
+    ready_times = []
+    script = STARTUP_SCRIPT.format(eager=eager, path=API_PATH)
+
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True,
+                                text=True, check=True).stdout
+        import_time, ready_time = map(float, output.split()[-2:])
+        import_times.append(import_time * 1000)
+        ready_times.append(ready_time * 1000)
+
+    return import_times, ready_times
+
+def report(label, import_times, ready_times):
+    print(f"{label:<6} import: median {statistics.median(import_times):7.1f} ms, "
+          f"min {min(import_times):7.1f} ms | first request ready: "
+          f"median {statistics.median(ready_times):7.1f} ms, min {min(ready_times):7.1f} ms")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure cold start time of the API process')
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    report('lazy', *measure(False, args.runs))
+    report('eager', *measure(True, args.runs))